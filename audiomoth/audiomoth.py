@@ -1,4 +1,5 @@
 import argparse
+import functools
 import logging
 import struct
 from dataclasses import dataclass
@@ -16,6 +17,25 @@ from audiomoth.utils import (
     _validate_parameter,
 )
 
+# Precompiled layout of the HID configuration message, shared by read and write
+_CFG_STRUCT = struct.Struct("<BLBBBBLBHH")
+
+# USB vendor/product ID of the AudioMoth (Silicon Labs EFM32)
+AUDIOMOTH_VID = 0x10C4
+AUDIOMOTH_PID = 0x0002
+
+# Configuration parameters that set_config may change on the device
+_SETTABLE = (
+    "gain",
+    "clock_divider",
+    "acquisition_cycles",
+    "oversamplerate",
+    "samplerate",
+    "samplerate_divider",
+    "lower_filter_freq",
+    "higher_filter_freq",
+)
+
 
 @dataclass
 class AudioMothConfig:
@@ -39,11 +59,16 @@ def get_all_usb_devices() -> list[dict[str, Any]]:
     return hid.enumerate()
 
 
+@functools.lru_cache(maxsize=8)
 def get_audiomoth_device(
     serial_number: str | None = None,
 ) -> dict[str, Any]:
     """Get an AudioMoth device attached via USB
 
+    The result is cached per serial number, so repeated calls within one process
+    do not re-enumerate the USB bus. Call get_audiomoth_device.cache_clear() after
+    hot-plugging devices.
+
     Args:
         serial_number (str | None): Serial number of devive to get. If not given and multiple devices are connected, the first device will be returned
 
@@ -53,22 +78,57 @@ def get_audiomoth_device(
     Returns:
         dict[str, Any]: Dictionary containing USB HID information
     """
-    devices: list[dict[str, Any]] = [
-        device for device in hid.enumerate() if "product_string" in device and "AudioMoth" in device["product_string"]
-    ]
-
-    if len(devices) == 0:
+    device: dict[str, Any] | None = next(
+        (
+            device
+            for device in hid.enumerate(AUDIOMOTH_VID, AUDIOMOTH_PID)
+            if "AudioMoth" in device.get("product_string", "")
+            and (serial_number is None or device.get("serial_number") == serial_number)
+        ),
+        None,
+    )
+
+    if device is None:
+        if serial_number is not None:
+            raise RuntimeError(f"Can not find AudioMoth with serial number {serial_number}")
         raise RuntimeError("Can not find any AudioMoth")
 
-    if serial_number is not None:
-        device: dict[str, Any] | None = next(
-            (device for device in devices if "serial_number" in device and device["serial_number"] == serial_number),
-            None,
+    return device
+
+
+def _read_config_from_device(audio_moth: dict[str, Any], device: hid.Device) -> AudioMothConfig:
+    """Read the configuration from an AudioMoth through an already-open HID handle
+
+    Args:
+        audio_moth (dict[str, Any]): USB HID information as returned by get_audiomoth_device
+        device (hid.Device): Open HID handle to that device
+
+    Raises:
+        RuntimeError: Raised if the configuration could not be read
+
+    Returns:
+        AudioMothConfig: Dataclass containing the config
+    """
+    device.write(HID_READ_MESSAGE)
+    read_data: bytes = device.read(18)
+    unpacked_data: tuple[Any] = _CFG_STRUCT.unpack(read_data)
+    if unpacked_data[0] != HID_READ_MESSAGE[0]:
+        raise RuntimeError(
+            "Could not read configuration from device [serial_number=%r, got=%r, expected=%r]"
+            % (audio_moth["serial_number"], unpacked_data[0], HID_READ_MESSAGE[0])
         )
-        if device is None:
-            raise RuntimeError(f"Can not find AudioMoth with serial number {serial_number}")
 
-    return devices[0]
+    return AudioMothConfig(
+        time=unpacked_data[1],
+        gain=unpacked_data[2],
+        clock_divider=unpacked_data[3],
+        acquisition_cycles=unpacked_data[4],
+        oversamplerate=unpacked_data[5],
+        samplerate=unpacked_data[6],
+        samplerate_divider=unpacked_data[7],
+        lower_filter_freq=unpacked_data[8],
+        higher_filter_freq=unpacked_data[9],
+    )
 
 
 def get_config(serial_number: str | None = None) -> AudioMothConfig:
@@ -90,27 +150,7 @@ def get_config(serial_number: str | None = None) -> AudioMothConfig:
         pid=audio_moth["product_id"],
         serial=audio_moth["serial_number"],
     ) as device:
-        device.write(HID_READ_MESSAGE)
-        read_data: bytes = device.read(18)
-        unpacked_data: tuple[Any] = struct.unpack("<BLBBBBLBHH", read_data)
-        if unpacked_data[0] != HID_READ_MESSAGE[0]:
-            serial_number = audio_moth["serial_number"]
-
-            raise RuntimeError(
-                f"Could not read configuration from device [{serial_number=}, [{unpacked_data[0]=}, {HID_READ_MESSAGE=}]"
-            )
-
-        return AudioMothConfig(
-            time=unpacked_data[1],
-            gain=unpacked_data[2],
-            clock_divider=unpacked_data[3],
-            acquisition_cycles=unpacked_data[4],
-            oversamplerate=unpacked_data[5],
-            samplerate=unpacked_data[6],
-            samplerate_divider=unpacked_data[7],
-            lower_filter_freq=unpacked_data[8],
-            higher_filter_freq=unpacked_data[9],
-        )
+        return _read_config_from_device(audio_moth, device)
 
 
 def set_config(
@@ -145,24 +185,37 @@ def set_config(
         AudioMothConfig: Returns newly set configuration
     """
     audio_moth: dict[str, Any] = get_audiomoth_device(serial_number)
-    old_cfg: AudioMothConfig = get_config(serial_number)
-
-    for param, value in locals().items():
-        if param != "audio_moth" and param != "old_cfg" and param != "serial_number" and value is not None:
-            sr = samplerate if samplerate is not None else old_cfg.samplerate
-            try:
-                _validate_parameter(param, value, sr)
-            except ValueError as e:
-                raise ValueError(e)
-            setattr(old_cfg, param, value)
 
     with hid.Device(
         vid=audio_moth["vendor_id"],
         pid=audio_moth["product_id"],
         serial=audio_moth["serial_number"],
     ) as device:
-        data: bytes = struct.pack(
-            "<BLBBBBLBHH",
+        old_cfg: AudioMothConfig = _read_config_from_device(audio_moth, device)
+
+        updates: dict[str, int | None] = dict(
+            zip(
+                _SETTABLE,
+                (
+                    gain,
+                    clock_divider,
+                    acquisition_cycles,
+                    oversamplerate,
+                    samplerate,
+                    samplerate_divider,
+                    lower_filter_freq,
+                    higher_filter_freq,
+                ),
+            )
+        )
+        sr: int = samplerate if samplerate is not None else old_cfg.samplerate
+
+        for param, value in updates.items():
+            if value is not None:
+                _validate_parameter(param, value, sr)
+                setattr(old_cfg, param, value)
+
+        data: bytes = _CFG_STRUCT.pack(
             HID_CONFIGURATION_MESSAGE[0],
             old_cfg.time,
             old_cfg.gain,
@@ -7,6 +7,9 @@ HID_RESTORE_MESSAGE = bytes([0x04])
 HID_READ_MESSAGE = bytes([0x05])
 HID_PERSIST_MESSAGE = bytes([0x06])
 
+_VALID_GAINS = frozenset((0, 1, 2, 3, 4))
+_VALID_SAMPLERATES = frozenset((8000, 16000, 32000, 48000, 96000, 192000, 250000, 384000))
+
 
 def _validate_parameter(parameter: str, value: int, sr: int) -> None:
     """AudioMoth has requirements to its configuration, especially for the gain, samplerate and band pass filters.
@@ -27,15 +30,15 @@ def _validate_parameter(parameter: str, value: int, sr: int) -> None:
 
     match parameter:
         case "gain":
-            if value not in [0, 1, 2, 3, 4]:
+            if value not in _VALID_GAINS:
                 raise ValueError(f"gain must on of [0, 1, 2, 3, 4], is {value}")
         case "samplerate":
-            if value not in [8000, 16000, 32000, 48000, 96000, 192000, 250000, 384000]:
+            if value not in _VALID_SAMPLERATES:
                 raise ValueError(
                     f"samplerate must on of [8000, 16000, 32000, 48000, 96000, 192000, 250000, 384000], is {value}"
                 )
         case "lower_filter_freq" | "higher_filter_freq":
-            if value % 100 != 0 or value > int(sr / 2):
+            if value % 100 != 0 or value > (sr >> 1):
                 raise ValueError(
                     f"band pass filters must be divisible by 100 and not bigger than half of samplerate, is {value}, samplerate is {sr}"
                 )
@@ -54,27 +57,27 @@ class ColoredFormatter(logging.Formatter):
 
     def __init__(self) -> None:
         super().__init__()
-        self.FORMATS: dict[int, str] = {
-            logging.DEBUG: self.grey + self.fmt + self.reset,
-            logging.INFO: self.blue + self.fmt + self.reset,
-            logging.WARNING: self.yellow + self.fmt + self.reset,
-            logging.ERROR: self.red + self.fmt + self.reset,
-            logging.CRITICAL: self.bold_red + self.fmt + self.reset,
+        self.FORMATS: dict[int, logging.Formatter] = {
+            logging.DEBUG: logging.Formatter(self.grey + self.fmt + self.reset),
+            logging.INFO: logging.Formatter(self.blue + self.fmt + self.reset),
+            logging.WARNING: logging.Formatter(self.yellow + self.fmt + self.reset),
+            logging.ERROR: logging.Formatter(self.red + self.fmt + self.reset),
+            logging.CRITICAL: logging.Formatter(self.bold_red + self.fmt + self.reset),
         }
 
     def format(self, record) -> str:
-        log_fmt: str = self.FORMATS.get(record.levelno, self.FORMATS[logging.INFO])
-        formatter = logging.Formatter(log_fmt)
+        formatter: logging.Formatter = self.FORMATS.get(record.levelno, self.FORMATS[logging.INFO])
         return formatter.format(record)
 
 
 class LoggingFilter(logging.Filter):
     def filter(self, record: logging.LogRecord) -> bool:
+        # Ignore the very verbose output of batdetects internals; the name check is a
+        # plain attribute access and avoids formatting the message for rejected records
+        if record.name.startswith("numba.core"):
+            return False
         # Ignore event messages from inotify
-        inotify_message: bool = not record.getMessage().startswith("Events received")
-        # Ignore the very verbose output of batdetects internals
-        batdetect_name: bool = not record.name.startswith("numba.core")
-        return inotify_message and batdetect_name
+        return not record.getMessage().startswith("Events received")
 
 
 def _setup_logging(log_level: str, log_file: str | None = None) -> None: